@@ -2,15 +2,15 @@
 """LoveACE release, announcement, and remote manifest CLI."""
 
 import hashlib
-import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from urllib.parse import urlsplit
 
 import typer
+from pydantic import ValidationError
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 from manifest import (
     ArtifactChecksums,
@@ -21,11 +21,17 @@ from manifest import (
     PlatformManifest,
     Release,
     ReleaseArtifact,
+    ReleasePlan,
+    ReleasePlanEntry,
     SemesterManifest,
+    CANONICAL_CDN_BASE_URL,
+    PLATFORM_SET,
     PLATFORMS,
     utc_now,
 )
-from s3_client import CANONICAL_CDN_BASE_URL, S3Client
+
+if TYPE_CHECKING:
+    from s3_client import S3Client
 
 
 app = typer.Typer(help="LoveACE 发布管理工具")
@@ -38,32 +44,19 @@ DOWNLOAD_PAGE_V2_KEY = "loveace/download_page_v2.html"
 FAVICON_KEY = "loveace/favicon.png"
 DOWNLOAD_ASSET_PREFIX = "loveace/assets"
 LOCAL_SEMESTER_FILE = Path(__file__).parent / "semesters.json"
-NATIVE_ARTIFACT_TYPES = {"apk", "exe", "msix", "dmg", "zip"}
-
+PLATFORMS_HELP = ", ".join(PLATFORMS)
 
-def dump_json(model) -> str:
-    return json.dumps(
-        model.model_dump(mode="json", exclude_none=True),
-        ensure_ascii=False,
-        indent=2,
-    )
 
+def dump_json(model) -> bytes:
+    return model.model_dump_json(exclude_none=True, indent=2).encode("utf-8")
 
-def get_file_hashes(file_path: Path) -> tuple[str, str]:
-    md5 = hashlib.md5()
-    sha256 = hashlib.sha256()
-    with file_path.open("rb") as file_handle:
-        for chunk in iter(lambda: file_handle.read(1024 * 1024), b""):
-            md5.update(chunk)
-            sha256.update(chunk)
-    return md5.hexdigest(), sha256.hexdigest()
 
+def get_client() -> "S3Client":
+    # OpenDAL's native extension dominates startup; only load it for commands
+    # that talk to S3 so --help and completion stay fast.
+    from s3_client import get_s3_client
 
-def infer_artifact_type(file_path: Path) -> str:
-    suffix = file_path.suffix.lower().lstrip(".")
-    if suffix not in NATIVE_ARTIFACT_TYPES:
-        raise typer.BadParameter(f"unsupported release artifact: {file_path.name}")
-    return suffix
+    return get_s3_client()
 
 
 def read_local_semesters(path: Path = LOCAL_SEMESTER_FILE) -> SemesterDataFile:
@@ -72,21 +65,21 @@ def read_local_semesters(path: Path = LOCAL_SEMESTER_FILE) -> SemesterDataFile:
     return SemesterDataFile.model_validate_json(path.read_text("utf-8"))
 
 
-def load_manifest_v2(client: S3Client) -> tuple[ManifestV2, bool]:
-    data = client.get_json(MANIFEST_V2_KEY, missing_ok=True)
+def load_manifest_v2(client: "S3Client") -> tuple[ManifestV2, bool]:
+    data = client.get_bytes(MANIFEST_V2_KEY, missing_ok=True)
     if data is not None:
-        return ManifestV2.model_validate(data), False
+        return ManifestV2.model_validate_json(data), False
 
-    legacy_data = client.get_json(LEGACY_MANIFEST_KEY, missing_ok=True)
+    legacy_data = client.get_bytes(LEGACY_MANIFEST_KEY, missing_ok=True)
     legacy = (
-        LoveACEManifest.model_validate(legacy_data)
+        LoveACEManifest.model_validate_json(legacy_data)
         if legacy_data is not None
         else LoveACEManifest()
     )
     return ManifestV2.from_legacy(legacy, read_local_semesters()), True
 
 
-def save_manifest_outputs(client: S3Client, manifest: ManifestV2) -> dict[str, str]:
+def save_manifest_outputs(client: "S3Client", manifest: ManifestV2) -> dict[str, str]:
     manifest.touch()
     legacy_manifest = manifest.to_legacy_manifest()
     urls = {
@@ -96,35 +89,40 @@ def save_manifest_outputs(client: S3Client, manifest: ManifestV2) -> dict[str, s
         ),
     }
 
-    saved_v2 = ManifestV2.model_validate(client.get_json(MANIFEST_V2_KEY))
+    saved_v2 = ManifestV2.model_validate_json(client.get_bytes(MANIFEST_V2_KEY))
     if saved_v2.revision != manifest.revision:
         raise RuntimeError("manifest v2 verification failed: revision mismatch")
-    LoveACEManifest.model_validate(client.get_json(LEGACY_MANIFEST_KEY))
+    LoveACEManifest.model_validate_json(client.get_bytes(LEGACY_MANIFEST_KEY))
     return urls
 
 
 def ensure_platform(platform: str) -> None:
-    if platform not in PLATFORMS:
+    if platform not in PLATFORM_SET:
         raise typer.BadParameter(
-            f"unsupported platform {platform}; expected one of {', '.join(PLATFORMS)}"
+            f"unsupported platform {platform}; expected one of {PLATFORMS_HELP}"
         )
 
 
+def skip_unchanged(migrated: bool, changed: bool) -> bool:
+    if migrated or changed:
+        return False
+    console.print("[yellow]Manifest unchanged; nothing published[/]")
+    return True
+
+
 def add_release(manifest: ManifestV2, platform: str, release: Release) -> PlatformManifest:
-    platform_manifest = manifest.platforms.get(platform, PlatformManifest())
-    platform_manifest.releases = [
-        item for item in platform_manifest.releases if item.id != release.id
-    ]
-    platform_manifest.releases.insert(0, release)
-    platform_manifest.releases = platform_manifest.releases[:10]
-    manifest.platforms[platform] = platform_manifest
+    platform_manifest = manifest.platforms.get(platform)
+    if platform_manifest is None:
+        platform_manifest = manifest.platforms[platform] = PlatformManifest()
+    others = (item for item in platform_manifest.releases if item.id != release.id)
+    platform_manifest.releases = [release, *islice(others, 9)]
     return platform_manifest
 
 
 @app.command()
 def bootstrap():
     """Create v2 and legacy projections without changing release data."""
-    client = S3Client()
+    client = get_client()
     manifest, migrated = load_manifest_v2(client)
     urls = save_manifest_outputs(client, manifest)
     action = "migrated from v1" if migrated else "republished"
@@ -133,6 +131,58 @@ def bootstrap():
         console.print(f"[dim]{name}: {url}[/]")
 
 
+def upload_release_artifact(client: "S3Client", entry: ReleasePlanEntry) -> Release:
+    object_key = (
+        f"loveace/releases/{entry.platform}/{entry.version}/{entry.build}/"
+        f"{entry.file.name}"
+    )
+    download_url, md5, sha256 = client.upload_file_with_hashes(
+        str(entry.file), object_key
+    )
+    expected_prefix = f"{CANONICAL_CDN_BASE_URL}/loveace/releases/"
+    if not download_url.startswith(expected_prefix):
+        raise RuntimeError(f"release URL is not canonical: {download_url}")
+
+    return Release(
+        id=f"{entry.platform}-{entry.version}-{entry.build}",
+        version=entry.version,
+        build=entry.build,
+        published_at=utc_now(),
+        summary=entry.content,
+        changelog=[entry.changelog] if entry.changelog else [],
+        artifacts=[
+            ReleaseArtifact(
+                type=entry.artifact_type,
+                arch=entry.arch,
+                url=download_url,
+                size=entry.file.stat().st_size,
+                checksums=ArtifactChecksums(sha256=sha256, md5=md5),
+            )
+        ],
+    )
+
+
+def publish_releases(
+    client: "S3Client", entries: list[ReleasePlanEntry]
+) -> tuple[list[Release], dict[str, str]]:
+    manifest, _ = load_manifest_v2(client)
+    names = ", ".join(entry.file.name for entry in entries)
+    with (
+        console.status(f"[bold blue]Uploading {names}..."),
+        ThreadPoolExecutor(max_workers=min(len(PLATFORMS), len(entries))) as pool,
+    ):
+        releases = list(
+            pool.map(lambda entry: upload_release_artifact(client, entry), entries)
+        )
+    for entry, release_record in zip(entries, releases):
+        platform_manifest = add_release(manifest, entry.platform, release_record)
+        if entry.force:
+            platform_manifest.minimum_supported_build = entry.build
+        elif entry.minimum_supported_build is not None:
+            platform_manifest.minimum_supported_build = entry.minimum_supported_build
+    return releases, save_manifest_outputs(client, manifest)
+
+
 @app.command()
 def release(
     version: str = typer.Option(..., "--version", "-v", help="Display version"),
@@ -148,58 +198,69 @@ def release(
     arch: str = typer.Option("universal", "--arch"),
 ):
     """Publish one native platform release and all manifest projections."""
+    from rich.panel import Panel
+
     ensure_platform(platform)
     if force and minimum_supported_build is not None:
         raise typer.BadParameter("use either --force or --minimum-supported-build")
 
-    client = S3Client()
-    manifest, _ = load_manifest_v2(client)
-    md5, sha256 = get_file_hashes(file)
-    artifact_type = infer_artifact_type(file)
-    object_key = f"loveace/releases/{platform}/{version}/{build}/{file.name}"
-    with console.status(f"[bold blue]Uploading {file.name}..."):
-        download_url = client.upload_file(str(file), object_key)
-    expected_prefix = f"{CANONICAL_CDN_BASE_URL}/loveace/releases/"
-    if not download_url.startswith(expected_prefix):
-        raise RuntimeError(f"release URL is not canonical: {download_url}")
-
-    release_record = Release(
-        id=f"{platform}-{version}-{build}",
-        version=version,
-        build=build,
-        published_at=utc_now(),
-        summary=content,
-        changelog=[changelog] if changelog else [],
-        artifacts=[
-            ReleaseArtifact(
-                type=artifact_type,
-                arch=arch,
-                url=download_url,
-                size=file.stat().st_size,
-                checksums=ArtifactChecksums(sha256=sha256, md5=md5),
-            )
-        ],
-    )
-    platform_manifest = add_release(manifest, platform, release_record)
-    if force:
-        platform_manifest.minimum_supported_build = build
-    elif minimum_supported_build is not None:
-        platform_manifest.minimum_supported_build = minimum_supported_build
-
-    urls = save_manifest_outputs(client, manifest)
+    try:
+        entry = ReleasePlanEntry(
+            platform=platform,
+            version=version,
+            build=build,
+            file=file,
+            force=force,
+            minimum_supported_build=minimum_supported_build,
+            content=content,
+            changelog=changelog,
+            arch=arch,
+        )
+    except ValidationError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    (release_record,), urls = publish_releases(get_client(), [entry])
+    artifact = release_record.artifacts[0]
     console.print(
         Panel.fit(
             f"[bold green]Release published[/]\n\n"
             f"[cyan]Platform:[/] {platform}\n"
             f"[cyan]Version:[/] {version} ({build})\n"
-            f"[cyan]SHA-256:[/] {sha256}\n"
-            f"[cyan]URL:[/] {download_url}",
+            f"[cyan]SHA-256:[/] {artifact.checksums.sha256}\n"
+            f"[cyan]URL:[/] {artifact.url}",
             title="Release",
         )
     )
     console.print(f"[dim]Manifest v2: {urls['v2']}[/]")
 
 
+@app.command("release-batch")
+def release_batch(
+    plan_file: Path = typer.Option(..., "--plan", "-f", exists=True, dir_okay=False),
+):
+    """Publish several native platform releases with one manifest update.
+
+    The plan is a JSON object with a ``releases`` list; each entry takes the
+    same fields as the ``release`` options. Relative artifact paths are
+    resolved against the plan file directory.
+    """
+    try:
+        plan = ReleasePlan.model_validate_json(plan_file.read_text("utf-8"))
+    except ValidationError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    for entry in plan.releases:
+        entry.file = plan_file.parent / entry.file
+        if not entry.file.is_file():
+            raise typer.BadParameter(f"release artifact not found: {entry.file}")
+
+    releases, urls = publish_releases(get_client(), plan.releases)
+    for release_record in releases:
+        console.print(
+            f"[green]Release published: {release_record.id}[/] "
+            f"[dim]{release_record.artifacts[0].url}[/]"
+        )
+    console.print(f"[dim]Manifest v2: {urls['v2']}[/]")
+
+
 @app.command()
 def web_release(
     version: str = typer.Option(..., "--version", "-v"),
@@ -218,7 +279,7 @@ def web_release(
     if parsed.scheme != "https" or not parsed.netloc:
         raise typer.BadParameter("--url must be absolute HTTPS")
 
-    client = S3Client()
+    client = get_client()
     manifest, _ = load_manifest_v2(client)
     release_id = f"{platform}-{version}-{build if build is not None else 'web'}"
     add_release(
@@ -263,7 +324,7 @@ def announce(
         digest = hashlib.sha256(f"{title}\0{content}".encode("utf-8")).hexdigest()
         announcement_id = f"announcement-{digest[:16]}"
 
-    client = S3Client()
+    client = get_client()
     manifest, _ = load_manifest_v2(client)
     announcement = ManifestAnnouncement(
         id=announcement_id,
@@ -288,16 +349,19 @@ def clear_announce(
     announcement_id: Optional[str] = typer.Option(None, "--id"),
 ):
     """Remove one announcement, or all app announcements when ID is omitted."""
-    client = S3Client()
-    manifest, _ = load_manifest_v2(client)
+    client = get_client()
+    manifest, migrated = load_manifest_v2(client)
     if announcement_id:
-        manifest.announcements = [
+        announcements = [
             item for item in manifest.announcements if item.id != announcement_id
         ]
     else:
-        manifest.announcements = [
+        announcements = [
             item for item in manifest.announcements if "app" not in item.surfaces
         ]
+    if skip_unchanged(migrated, len(announcements) != len(manifest.announcements)):
+        return
+    manifest.announcements = announcements
     save_manifest_outputs(client, manifest)
     console.print("[green]Announcement cleared[/]")
 
@@ -305,7 +369,7 @@ def clear_announce(
 @app.command()
 def notice(content: str = typer.Option(..., "--content", "-c")):
     """Set the global download-page notice."""
-    client = S3Client()
+    client = get_client()
     manifest, _ = load_manifest_v2(client)
     manifest.announcements = [
         item for item in manifest.announcements if item.id != "download-notice"
@@ -328,13 +392,16 @@ def notice(content: str = typer.Option(..., "--content", "-c")):
 @app.command()
 def clear_notice():
     """Clear the global download-page notice."""
-    client = S3Client()
-    manifest, _ = load_manifest_v2(client)
-    manifest.announcements = [
+    client = get_client()
+    manifest, migrated = load_manifest_v2(client)
+    announcements = [
         item
         for item in manifest.announcements
         if item.id != "download-notice" and "download" not in item.surfaces
     ]
+    if skip_unchanged(migrated, len(announcements) != len(manifest.announcements)):
+        return
+    manifest.announcements = announcements
     save_manifest_outputs(client, manifest)
     console.print("[green]Download notice cleared[/]")
 
@@ -347,9 +414,12 @@ def sync_semesters(
 ):
     """Update semester data in the canonical v2 manifest."""
     semester_data = SemesterDataFile.model_validate_json(file.read_text("utf-8"))
-    client = S3Client()
-    manifest, _ = load_manifest_v2(client)
-    manifest.semester = SemesterManifest.from_data_file(semester_data)
+    client = get_client()
+    manifest, migrated = load_manifest_v2(client)
+    semester = SemesterManifest.from_data_file(semester_data)
+    if skip_unchanged(migrated, semester != manifest.semester):
+        return
+    manifest.semester = semester
     urls = save_manifest_outputs(client, manifest)
     console.print(f"[green]Semester data published: {manifest.revision}[/]")
     console.print(f"[dim]Manifest v2: {urls['v2']}[/]")
@@ -362,15 +432,20 @@ def set_force(
 ):
     """Set the legacy-compatible force policy for the latest platform build."""
     ensure_platform(platform)
-    client = S3Client()
-    manifest, _ = load_manifest_v2(client)
+    client = get_client()
+    manifest, migrated = load_manifest_v2(client)
     platform_manifest = manifest.platforms.get(platform)
     if not platform_manifest or not platform_manifest.releases:
         raise typer.BadParameter(f"platform has no release: {platform}")
     latest = platform_manifest.releases[0]
     if force and latest.build is None:
         raise typer.BadParameter("migrated release has no build number")
-    platform_manifest.minimum_supported_build = latest.build if force else None
+    minimum_supported_build = latest.build if force else None
+    if skip_unchanged(
+        migrated, minimum_supported_build != platform_manifest.minimum_supported_build
+    ):
+        return
+    platform_manifest.minimum_supported_build = minimum_supported_build
     save_manifest_outputs(client, manifest)
     console.print(f"[green]{platform} force policy updated[/]")
 
@@ -378,11 +453,18 @@ def set_force(
 @app.command()
 def status():
     """Display the canonical v2 manifest status."""
-    client = S3Client()
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
+    client = get_client()
     manifest, migrated = load_manifest_v2(client)
+    renderables = []
     if migrated:
-        console.print("[yellow]manifest_v2.json does not exist; showing v1 migration preview[/]")
-    console.print(
+        renderables.append(
+            "[yellow]manifest_v2.json does not exist; showing v1 migration preview[/]"
+        )
+    renderables.append(
         Panel.fit(
             f"[cyan]Schema:[/] {manifest.schema_version}\n"
             f"[cyan]Revision:[/] {manifest.revision}\n"
@@ -392,12 +474,14 @@ def status():
             title="Manifest v2",
         )
     )
-    table = Table(title="Latest releases")
-    table.add_column("Platform")
-    table.add_column("Version")
-    table.add_column("Build")
-    table.add_column("Artifact")
-    table.add_column("Minimum build")
+    table = Table(
+        "Platform",
+        "Version",
+        "Build",
+        "Artifact",
+        "Minimum build",
+        title="Latest releases",
+    )
     for platform in PLATFORMS:
         platform_manifest = manifest.platforms.get(platform)
         if not platform_manifest or not platform_manifest.releases:
@@ -410,13 +494,14 @@ def status():
             latest.artifacts[0].type,
             str(platform_manifest.minimum_supported_build or "-"),
         )
-    console.print(table)
+    renderables.append(table)
+    console.print(Group(*renderables))
 
 
 @app.command()
 def deploy_page():
     """Deploy the v2 download page to its canonical path and alias."""
-    client = S3Client()
+    client = get_client()
     base_path = Path(__file__).parent
     assets = [
         (base_path / "download_page_v2.html", DOWNLOAD_PAGE_KEY),
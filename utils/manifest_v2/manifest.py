@@ -1,6 +1,9 @@
 import hashlib
 from datetime import datetime, timezone
-from typing import Literal, Optional
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Any, Literal, Optional
 from urllib.parse import urlsplit, urlunsplit
 from uuid import uuid4
 
@@ -10,13 +13,17 @@ from pydantic import (
     Field,
     computed_field,
     field_validator,
+    model_serializer,
     model_validator,
 )
 
 
 PLATFORMS = ("android", "ios", "windows", "macos", "linux")
-NATIVE_ARTIFACT_TYPES = {"apk", "exe", "msix", "dmg", "zip"}
+PLATFORM_SET = frozenset(PLATFORMS)
+ANNOUNCEMENT_PLATFORMS = PLATFORM_SET | {"all"}
+NATIVE_ARTIFACT_TYPES = frozenset({"apk", "exe", "msix", "dmg", "zip"})
 CANONICAL_RELEASE_HOST = "release.loveace.top"
+CANONICAL_CDN_BASE_URL = f"https://{CANONICAL_RELEASE_HOST}"
 RELEASE_PATH_PREFIX = "/loveace/releases/"
 
 
@@ -34,8 +41,18 @@ class Announcement(BaseModel):
     @computed_field
     @property
     def md5(self) -> str:
-        combined = f"{self.title}{self.content}"
-        return hashlib.md5(combined.encode("utf-8")).hexdigest()
+        # Keyed on the current title/content rather than stored on the instance,
+        # so model_copy(update=...) and model_construct never see a stale digest.
+        return _announcement_md5(self.title, self.content)
+
+
+@lru_cache(maxsize=32)
+def _announcement_md5(title: str, content: str) -> str:
+    digest = hashlib.md5(usedforsecurity=False)
+    digest.update(title.encode("utf-8"))
+    digest.update(content.encode("utf-8"))
+    return digest.hexdigest()
+
 
 class ChangelogEntry(BaseModel):
     version: str
@@ -51,14 +68,42 @@ class PlatformRelease(BaseModel):
 
 
 class OTA(BaseModel):
+    """Legacy OTA section; platform releases are top-level keys on the wire."""
+
     content: str = ""
     notice: Optional[str] = None
     changelog: list[ChangelogEntry] = Field(default_factory=list, max_length=10)
-    android: Optional[PlatformRelease] = None
-    ios: Optional[PlatformRelease] = None
-    windows: Optional[PlatformRelease] = None
-    macos: Optional[PlatformRelease] = None
-    linux: Optional[PlatformRelease] = None
+    platforms: dict[str, PlatformRelease] = Field(default_factory=dict)
+
+    @model_validator(mode="before")
+    @classmethod
+    def collect_platforms(cls, data):
+        if not isinstance(data, dict) or PLATFORM_SET.isdisjoint(data):
+            return data
+        data = dict(data)
+        platforms = dict(data.get("platforms") or {})
+        for platform in PLATFORMS:
+            release = data.pop(platform, None)
+            if release is not None:
+                platforms[platform] = release
+        data["platforms"] = platforms
+        return data
+
+    @field_validator("platforms")
+    @classmethod
+    def validate_platform_keys(
+        cls, value: dict[str, PlatformRelease]
+    ) -> dict[str, PlatformRelease]:
+        invalid = value.keys() - PLATFORM_SET
+        if invalid:
+            raise ValueError(f"unsupported platforms: {sorted(invalid)}")
+        return value
+
+    @model_serializer(mode="wrap")
+    def flatten_platforms(self, handler) -> dict[str, Any]:
+        data = handler(self)
+        data.update(data.pop("platforms", {}))
+        return data
 
 
 class LoveACEManifest(BaseModel):
@@ -135,7 +180,7 @@ class ManifestAnnouncement(BaseModel):
     def validate_platforms(cls, values: list[str]) -> list[str]:
         if not values:
             raise ValueError("announcement must target at least one platform")
-        invalid = set(values) - set(PLATFORMS) - {"all"}
+        invalid = set(values) - ANNOUNCEMENT_PLATFORMS
         if invalid:
             raise ValueError(f"unsupported announcement platforms: {sorted(invalid)}")
         return list(dict.fromkeys(values))
@@ -214,7 +259,7 @@ class ManifestV2(BaseModel):
     def validate_platform_keys(
         cls, value: dict[str, PlatformManifest]
     ) -> dict[str, PlatformManifest]:
-        invalid = set(value) - set(PLATFORMS)
+        invalid = value.keys() - PLATFORM_SET
         if invalid:
             raise ValueError(f"unsupported platforms: {sorted(invalid)}")
         return value
@@ -265,44 +310,36 @@ class ManifestV2(BaseModel):
                 latest.build is not None
                 and platform_manifest.minimum_supported_build == latest.build
             )
-            setattr(
-                ota,
-                platform,
-                PlatformRelease(
-                    version=latest.version,
-                    force_ota=force_ota,
-                    url=artifact.url,
-                    md5=artifact.checksums.md5,
-                    type="web" if is_web else "native",
-                ),
+            ota.platforms[platform] = PlatformRelease(
+                version=latest.version,
+                force_ota=force_ota,
+                url=artifact.url,
+                md5=artifact.checksums.md5,
+                type="web" if is_web else "native",
             )
 
         releases.sort(key=lambda item: item[1].published_at, reverse=True)
         if releases:
             ota.content = releases[0][1].summary
 
-        changelog_entries: list[tuple[str, ChangelogEntry]] = []
-        for platform, platform_manifest in self.platforms.items():
-            for release in platform_manifest.releases:
-                for change in release.changelog:
-                    changelog_entries.append(
-                        (
-                            release.published_at,
-                            ChangelogEntry(
-                                version=f"{platform.capitalize()} {release.version}",
-                                changes=change,
-                            ),
-                        )
-                    )
-        changelog_entries.sort(key=lambda item: item[0], reverse=True)
-        generated_changelog = [entry for _, entry in changelog_entries]
-        seen = {(entry.version, entry.changes) for entry in generated_changelog}
+        changes = [
+            (release.published_at, f"{platform.capitalize()} {release.version}", change)
+            for platform, platform_manifest in self.platforms.items()
+            for release in platform_manifest.releases
+            for change in release.changelog
+        ]
+        changes.sort(key=lambda item: item[0], reverse=True)
+        # Keyed on (version, changes): dedupes in insertion order, and entries
+        # are only built for the ten that survive the cut.
+        merged: dict[tuple[str, str], Optional[ChangelogEntry]] = dict.fromkeys(
+            (version, change) for _, version, change in changes
+        )
         for entry in self.legacy_projection.changelog:
-            identity = (entry.version, entry.changes)
-            if identity not in seen:
-                generated_changelog.append(entry)
-                seen.add(identity)
-        ota.changelog = generated_changelog[:10]
+            merged.setdefault((entry.version, entry.changes), entry)
+        ota.changelog = [
+            entry or ChangelogEntry(version=version, changes=change)
+            for (version, change), entry in islice(merged.items(), 10)
+        ]
 
         return LoveACEManifest(announcement=announcement, ota=ota)
 
@@ -344,7 +381,7 @@ class ManifestV2(BaseModel):
         platforms: dict[str, PlatformManifest] = {}
         if manifest.ota:
             for platform in PLATFORMS:
-                legacy_release = getattr(manifest.ota, platform, None)
+                legacy_release = manifest.ota.platforms.get(platform)
                 if not legacy_release:
                     continue
                 artifact_type = (
@@ -401,6 +438,59 @@ class ManifestV2(BaseModel):
         )
 
 
+class ReleasePlanEntry(BaseModel):
+    """One native artifact published by a release plan."""
+
+    platform: str
+    version: str
+    build: int = Field(ge=0)
+    file: Path
+    force: bool = False
+    minimum_supported_build: Optional[int] = Field(default=None, ge=0)
+    content: str = ""
+    changelog: str = ""
+    arch: str = "universal"
+
+    @field_validator("platform")
+    @classmethod
+    def validate_platform(cls, value: str) -> str:
+        if value not in PLATFORM_SET:
+            raise ValueError(f"unsupported platform: {value}")
+        return value
+
+    @field_validator("file")
+    @classmethod
+    def validate_file_type(cls, value: Path) -> Path:
+        if _artifact_suffix(value) not in NATIVE_ARTIFACT_TYPES:
+            raise ValueError(f"unsupported release artifact: {value.name}")
+        return value
+
+    @property
+    def artifact_type(self) -> str:
+        return _artifact_suffix(self.file)
+
+    @model_validator(mode="after")
+    def validate_force_policy(self):
+        if self.force and self.minimum_supported_build is not None:
+            raise ValueError("use either force or minimum_supported_build")
+        return self
+
+
+class ReleasePlan(BaseModel):
+    releases: list[ReleasePlanEntry] = Field(min_length=1)
+
+    @model_validator(mode="after")
+    def validate_unique_platforms(self):
+        platforms = [entry.platform for entry in self.releases]
+        if len(platforms) != len(set(platforms)):
+            raise ValueError("release plan platforms must be unique")
+        return self
+
+
+def _artifact_suffix(path: Path) -> str:
+    return path.suffix.lower().lstrip(".")
+
+
 def _infer_artifact_type(url: str) -> str:
     suffix = urlsplit(url).path.rsplit(".", 1)[-1].lower()
     if suffix in NATIVE_ARTIFACT_TYPES:
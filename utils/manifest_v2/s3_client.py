@@ -1,13 +1,23 @@
-import json
-import mimetypes
+import hashlib
+import os
+from functools import lru_cache
+
 import opendal
 from config import get_settings
-from manifest import CANONICAL_RELEASE_HOST
+from manifest import CANONICAL_CDN_BASE_URL
 
 
-# 添加 APK 的 MIME 类型
-mimetypes.add_type("application/vnd.android.package-archive", ".apk")
-CANONICAL_CDN_BASE_URL = f"https://{CANONICAL_RELEASE_HOST}"
+# 直接查表，不走 mimetypes；.exe、.msix 等未列出的类型按 application/octet-stream 上传
+CONTENT_TYPES = {
+    ".apk": "application/vnd.android.package-archive",
+    ".dmg": "application/x-apple-diskimage",
+    ".zip": "application/zip",
+    ".html": "text/html; charset=utf-8",
+    ".json": "application/json",
+    ".png": "image/png",
+    ".webp": "image/webp",
+}
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
 
 
 class S3Client:
@@ -37,16 +47,38 @@ class S3Client:
 
     def _get_content_type(self, filename: str) -> str:
         """根据文件名获取 Content-Type"""
-        content_type, _ = mimetypes.guess_type(filename)
-        return content_type or "application/octet-stream"
+        suffix = os.path.splitext(filename)[1].lower()
+        return CONTENT_TYPES.get(suffix, "application/octet-stream")
+
+    def _stream_file(self, local_path: str, s3_key: str, *digests) -> None:
+        """按块流式写入 S3，块大小同时作为分片上传的分片大小"""
+        content_type = self._get_content_type(local_path)
+        # writer 只接受 bytes（不支持 memoryview），无缓冲读取让每块直接读入该 bytes
+        with (
+            open(local_path, "rb", buffering=0) as f,
+            self.op.open(
+                s3_key, "wb", content_type=content_type, chunk=UPLOAD_CHUNK_SIZE
+            ) as writer,
+        ):
+            for chunk in iter(lambda: f.read(UPLOAD_CHUNK_SIZE), b""):
+                for digest in digests:
+                    digest.update(chunk)
+                writer.write(chunk)
 
     def upload_file(self, local_path: str, s3_key: str) -> str:
         """上传文件到 S3"""
-        content_type = self._get_content_type(local_path)
-        with open(local_path, "rb") as f:
-            self.op.write(s3_key, f.read(), content_type=content_type)
+        self._stream_file(local_path, s3_key)
         return self._get_url(s3_key)
 
+    def upload_file_with_hashes(
+        self, local_path: str, s3_key: str
+    ) -> tuple[str, str, str]:
+        """流式上传文件到 S3，同时计算 MD5 和 SHA-256，文件只读取一次"""
+        md5 = hashlib.md5(usedforsecurity=False)
+        sha256 = hashlib.sha256()
+        self._stream_file(local_path, s3_key, md5, sha256)
+        return self._get_url(s3_key), md5.hexdigest(), sha256.hexdigest()
+
     def upload_content(self, content: str | bytes, s3_key: str) -> str:
         """上传内容到 S3"""
         if isinstance(content, str):
@@ -55,11 +87,10 @@ class S3Client:
         self.op.write(s3_key, content, content_type=content_type)
         return self._get_url(s3_key)
 
-    def get_json(self, s3_key: str, *, missing_ok: bool = False) -> dict | None:
-        """获取 JSON 文件"""
+    def get_bytes(self, s3_key: str, *, missing_ok: bool = False) -> bytes | None:
+        """获取文件原始内容"""
         try:
-            data = self.op.read(s3_key)
-            return json.loads(data.decode("utf-8"))
+            return self.op.read(s3_key)
         except opendal.exceptions.NotFound:
             if missing_ok:
                 return None
@@ -72,3 +103,8 @@ class S3Client:
             return True
         except opendal.exceptions.NotFound:
             return False
+
+
+@lru_cache
+def get_s3_client() -> S3Client:
+    return S3Client()
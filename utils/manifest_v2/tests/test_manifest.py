@@ -1,11 +1,21 @@
+import hashlib
 import json
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
+
+import opendal
+from typer.testing import CliRunner
 
 from cli import (
     LEGACY_MANIFEST_KEY,
+    app,
     MANIFEST_V2_KEY,
     load_manifest_v2,
+    publish_releases,
     save_manifest_outputs,
+    set_force,
 )
 from manifest import (
     Announcement,
@@ -19,9 +29,11 @@ from manifest import (
     PlatformRelease,
     Release,
     ReleaseArtifact,
+    ReleasePlan,
     SemesterEntry,
     SemesterManifest,
 )
+from s3_client import S3Client
 
 
 def semester_data() -> SemesterDataFile:
@@ -39,6 +51,13 @@ def semester_data() -> SemesterDataFile:
     )
 
 
+def fs_client(root: Path) -> S3Client:
+    client = object.__new__(S3Client)
+    client.cdn_base_url = "https://release.loveace.top"
+    client.op = opendal.Operator("fs", root=str(root))
+    return client
+
+
 class FakeClient:
     def __init__(self, objects=None):
         self.objects = objects or {}
@@ -49,6 +68,10 @@ class FakeClient:
             raise FileNotFoundError(key)
         return value
 
+    def get_bytes(self, key, *, missing_ok=False):
+        value = self.get_json(key, missing_ok=missing_ok)
+        return json.dumps(value).encode("utf-8") if value is not None else None
+
     def upload_content(self, content, key):
         self.objects[key] = json.loads(content)
         return f"https://release.loveace.top/{key}"
@@ -60,6 +83,14 @@ class ManifestTests(unittest.TestCase):
         payload = json.loads(announcement.model_dump_json())
         self.assertEqual(payload["md5"], announcement.md5)
 
+    def test_legacy_announcement_md5_follows_copied_text(self):
+        announcement = Announcement(title="Title", content="Body", md5="stale")
+        copied = announcement.model_copy(update={"title": "New"})
+        self.assertEqual(
+            announcement.md5, hashlib.md5("TitleBody".encode("utf-8")).hexdigest()
+        )
+        self.assertEqual(copied.md5, hashlib.md5("NewBody".encode("utf-8")).hexdigest())
+
     def test_migration_rewrites_native_release_to_canonical_cdn(self):
         legacy = LoveACEManifest(
             ota=OTA(
@@ -119,11 +150,52 @@ class ManifestTests(unittest.TestCase):
             },
         )
         legacy = manifest.to_legacy_manifest()
-        self.assertEqual(legacy.ota.android.version, "1.2.3")
-        self.assertTrue(legacy.ota.android.force_ota)
-        self.assertEqual(legacy.ota.android.md5, "md5")
+        self.assertEqual(legacy.ota.platforms["android"].version, "1.2.3")
+        self.assertTrue(legacy.ota.platforms["android"].force_ota)
+        self.assertEqual(legacy.ota.platforms["android"].md5, "md5")
         self.assertEqual(legacy.ota.changelog[0].version, "Android 1.2.3")
 
+        payload = json.loads(legacy.model_dump_json(exclude_none=True))
+        self.assertNotIn("platforms", payload["ota"])
+        self.assertEqual(payload["ota"]["android"]["md5"], "md5")
+        self.assertEqual(
+            LoveACEManifest.model_validate(payload).ota.platforms["android"],
+            legacy.ota.platforms["android"],
+        )
+
+    def test_legacy_changelog_merges_without_duplicates(self):
+        manifest = ManifestV2(
+            semester=SemesterManifest.from_data_file(semester_data()),
+            platforms={
+                "android": PlatformManifest(
+                    releases=[
+                        Release(
+                            id="android-1.2.3-web",
+                            version="1.2.3",
+                            published_at="2026-07-23T00:00:00Z",
+                            changelog=[f"Change {index}" for index in range(9)],
+                            artifacts=[
+                                ReleaseArtifact(
+                                    type="web", url="https://example.com/android"
+                                )
+                            ],
+                        )
+                    ]
+                )
+            },
+            legacy_projection={
+                "changelog": [
+                    ChangelogEntry(version="Android 1.2.3", changes="Change 0"),
+                    ChangelogEntry(version="1.0.0", changes="Legacy"),
+                    ChangelogEntry(version="0.9.0", changes="Dropped"),
+                ]
+            },
+        )
+        changelog = manifest.to_legacy_manifest().ota.changelog
+        self.assertEqual(len(changelog), 10)
+        self.assertEqual(changelog[0].changes, "Change 0")
+        self.assertEqual(changelog[-1].version, "1.0.0")
+
     def test_save_outputs_share_one_v2_snapshot(self):
         client = FakeClient()
         manifest = ManifestV2(
@@ -148,6 +220,147 @@ class ManifestTests(unittest.TestCase):
         self.assertTrue(migrated)
         self.assertEqual(manifest.announcements[0].title, "Hello")
 
+    def test_upload_hashes_match_uploaded_object(self):
+        payload = bytes(range(256)) * 5000
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "app.apk"
+            path.write_bytes(payload)
+            client = fs_client(Path(directory) / "bucket")
+            url, md5, sha256 = client.upload_file_with_hashes(
+                str(path), "loveace/releases/android/1.0.0/1/app.apk"
+            )
+            uploaded = bytes(
+                client.op.read("loveace/releases/android/1.0.0/1/app.apk")
+            )
+        self.assertEqual(
+            url,
+            "https://release.loveace.top/loveace/releases/android/1.0.0/1/app.apk",
+        )
+        self.assertEqual(uploaded, payload)
+        self.assertEqual(md5, hashlib.md5(payload).hexdigest())
+        self.assertEqual(sha256, hashlib.sha256(payload).hexdigest())
+
+    def test_release_plan_rejects_duplicate_platforms(self):
+        entry = {"platform": "android", "version": "1.0.0", "build": 1, "file": "a.apk"}
+        with self.assertRaises(ValueError):
+            ReleasePlan.model_validate({"releases": [entry, entry]})
+
+    def test_release_batch_reports_invalid_plan_as_bad_parameter(self):
+        with tempfile.TemporaryDirectory() as directory:
+            plan_file = Path(directory) / "plan.json"
+            plan_file.write_text(
+                json.dumps(
+                    {
+                        "releases": [
+                            {
+                                "platform": "bsd",
+                                "version": "1.0.0",
+                                "build": 1,
+                                "file": "a.apk",
+                            }
+                        ]
+                    }
+                ),
+                "utf-8",
+            )
+            result = CliRunner().invoke(app, ["release-batch", "--plan", str(plan_file)])
+        self.assertEqual(result.exit_code, 2)
+        self.assertNotIsInstance(result.exception, ValueError)
+
+    def test_publish_releases_saves_all_platforms_once(self):
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            (root / "app.apk").write_bytes(b"android")
+            (root / "app.exe").write_bytes(b"windows")
+            plan = ReleasePlan.model_validate(
+                {
+                    "releases": [
+                        {
+                            "platform": "android",
+                            "version": "1.2.3",
+                            "build": 10203,
+                            "file": root / "app.apk",
+                            "force": True,
+                        },
+                        {
+                            "platform": "windows",
+                            "version": "1.2.3",
+                            "build": 10203,
+                            "file": root / "app.exe",
+                        },
+                    ]
+                }
+            )
+            client = fs_client(root / "bucket")
+            releases, urls = publish_releases(client, plan.releases)
+            manifest, migrated = load_manifest_v2(client)
+
+        self.assertFalse(migrated)
+        self.assertEqual(set(urls), {"v2", "legacy_ota"})
+        self.assertEqual(
+            [release.id for release in releases],
+            ["android-1.2.3-10203", "windows-1.2.3-10203"],
+        )
+        self.assertEqual(manifest.platforms["android"].minimum_supported_build, 10203)
+        self.assertIsNone(manifest.platforms["windows"].minimum_supported_build)
+        self.assertEqual(
+            manifest.platforms["windows"].releases[0].artifacts[0].checksums.md5,
+            hashlib.md5(b"windows").hexdigest(),
+        )
+
+    def test_set_force_skips_publish_when_policy_is_unchanged(self):
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            (root / "app.apk").write_bytes(b"android")
+            plan = ReleasePlan.model_validate(
+                {
+                    "releases": [
+                        {
+                            "platform": "android",
+                            "version": "1.2.3",
+                            "build": 10203,
+                            "file": root / "app.apk",
+                        }
+                    ]
+                }
+            )
+            client = fs_client(root / "bucket")
+            publish_releases(client, plan.releases)
+            before, _ = load_manifest_v2(client)
+            with (
+                mock.patch("cli.get_client", return_value=client),
+                mock.patch("cli.console"),
+            ):
+                set_force(platform="android", force=False)
+                unchanged, _ = load_manifest_v2(client)
+                set_force(platform="android", force=True)
+                forced, _ = load_manifest_v2(client)
+
+        self.assertEqual(unchanged.revision, before.revision)
+        self.assertNotEqual(forced.revision, before.revision)
+        self.assertEqual(forced.platforms["android"].minimum_supported_build, 10203)
+
+    def test_sync_semesters_skips_publish_when_data_is_unchanged(self):
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            semester_file = root / "semesters.json"
+            semester_file.write_text(semester_data().model_dump_json(), "utf-8")
+            client = fs_client(root / "bucket")
+            save_manifest_outputs(
+                client,
+                ManifestV2(semester=SemesterManifest.from_data_file(semester_data())),
+            )
+            before, _ = load_manifest_v2(client)
+            with mock.patch("cli.get_client", return_value=client):
+                result = CliRunner().invoke(
+                    app, ["sync-semesters", "--file", str(semester_file)]
+                )
+            after, _ = load_manifest_v2(client)
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("Manifest unchanged", result.output)
+        self.assertEqual(after.revision, before.revision)
+
 
 if __name__ == "__main__":
     unittest.main()